@@ -25,18 +25,32 @@ keep the default so that users opt in.
      categories: [it]
      disabled: true       # set to false on your own instance
 
+The cached catalogue is signed with keyed BLAKE2b and verified before use.  The
+key is taken from ``hmac_secret_key``, the ``PROXMOXVE_CACHE_HMAC_KEY``
+environment variable or a ``.hmac_secret`` file next to the engine, which is
+generated on first start.  Set ``verify_cache_integrity: false`` to store the
+catalogue unsigned, e.g. when the cache database is only writable by SearXNG.
+
+.. code:: yaml
+
+     hmac_secret_key: "..."         # optional, defaults to .hmac_secret
+     verify_cache_integrity: true   # default
+
 Implementations
 ===============
 
 """
 
 import hashlib
+import heapq
 import hmac
 import json
 import os
 import pathlib
 import re
 import secrets
+import threading
+import time
 import typing as t
 import unicodedata
 import zlib
@@ -68,8 +82,21 @@ about = {
 
 _SCRIPT_URL = "https://community-scripts.github.io/ProxmoxVE/scripts?id={slug}"
 _CACHE_TTL = 43200  # 12 hours in seconds
+_MEMORY_TTL = 3600  # 1 hour in seconds, the persistent cache stays authoritative
+_REFRESH_BACKOFF = 60  # seconds between refresh attempts while the upstream API is failing
 _MAX_RESULTS = 20
 _MAX_CACHE_VALUE_LEN = 10240  # 10 KB
+_CACHE_CHUNK_LEN = _MAX_CACHE_VALUE_LEN - 256  # headroom for EngineCache's own pickle framing
+_MAC_SIZE = 32
+_CACHE_KEY = "scripts_blob_v2"  # bump whenever the cached record layout changes
+_ZLIB_LEVEL = 6
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WS = re.compile(r"[ \t\n\r]*")
+
+_SLUG_VALID = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+_SLUG_NONALNUM = re.compile(r"[^a-z0-9]+")
+_SLUG_DEDUP_DASH = re.compile(r"-{2,}")
 
 _logger = logger.getChild("community_scripts_proxmoxve")
 
@@ -77,17 +104,72 @@ _HMAC_SECRET_KEY: t.Optional[bytes] = None
 CACHE: EngineCache
 """Persistent (SQLite) key/value cache that stores the fetched script catalogue."""
 
+_SCRIPTS_MEM: t.Optional[list[dict[str, t.Any]]] = None
+"""Deserialized catalogue kept in process memory, so that warm searches skip
+the cache read, signature check, decompression and JSON parsing."""
+_SCRIPTS_MEM_EXPIRY: float = 0.0
+_SCRIPTS_MEM_LOCK = threading.RLock()
+_REFRESH_FAILED_AT: t.Optional[float] = None
+"""When the last refresh failed.  Until :py:obj:`_REFRESH_BACKOFF` has passed,
+searches that miss the persistent cache return what is in memory instead of
+each running the (up to 30 s) fetch again."""
+
 
 def _slugify(value: str, max_len: int = 64) -> str:
     """Normalizes a string to a slug."""
-    value = unicodedata.normalize("NFKD", value)
-    value = "".join(ch for ch in value if not unicodedata.combining(ch))
+    # Upstream slugs are almost always well-formed already.
+    if _SLUG_VALID.fullmatch(value):
+        return value[:max_len]
+    # Nearly all slugs are plain ASCII, for which NFKD is a no-op and there
+    # are no combining characters to strip.
+    if not value.isascii():
+        if not unicodedata.is_normalized("NFKD", value):
+            value = unicodedata.normalize("NFKD", value)
+        value = "".join(ch for ch in value if not unicodedata.combining(ch))
     value = value.lower()
-    value = re.sub(r"[^a-z0-9]+", "-", value)
-    value = re.sub(r"-{2,}", "-", value).strip("-")
+    value = _SLUG_NONALNUM.sub("-", value)
+    value = _SLUG_DEDUP_DASH.sub("-", value).strip("-")
     return value[:max_len]
 
 
+def _skip_ws(text: str, pos: int) -> int:
+    """Return the position of the first non-whitespace character at or after ``pos``."""
+    m = _JSON_WS.match(text, pos)
+    assert m is not None  # the pattern also matches the empty string
+    return m.end()
+
+
+def _iter_json_array(text: str) -> t.Iterator[t.Any]:
+    """Decode the items of a top-level JSON array one at a time.
+
+    Unlike :py:obj:`json.loads`, only one item is materialized at a time, so
+    the tree of the whole document is never held in memory.  Raises
+    ``ValueError`` on malformed JSON.
+    """
+    pos = _skip_ws(text, 0)
+    if not text.startswith("[", pos):
+        raise ValueError(f"Expecting '[' at position {pos}")
+    pos = _skip_ws(text, pos + 1)
+
+    if text.startswith("]", pos):
+        pos += 1
+    else:
+        while True:
+            item, pos = _JSON_DECODER.raw_decode(text, pos)
+            yield item
+            pos = _skip_ws(text, pos)
+            if text.startswith(",", pos):
+                pos = _skip_ws(text, pos + 1)
+            elif text.startswith("]", pos):
+                pos += 1
+                break
+            else:
+                raise ValueError(f"Expecting ',' or ']' at position {pos}")
+
+    if _skip_ws(text, pos) != len(text):
+        raise ValueError(f"Extra data at position {pos}")
+
+
 def _fetch_scripts() -> list[dict[str, t.Any]]:
     """Fetch all scripts from the community-scripts API and return a flat, deduplicated list."""
     try:
@@ -95,18 +177,33 @@ def _fetch_scripts() -> list[dict[str, t.Any]]:
         if resp.status_code != 200:
             _logger.warning("Unexpected community scripts API status: %s", resp.status_code)
             return []
-        data = resp.json()
-    except (ValueError, HTTPError, TimeoutException) as e:
+        # resp.json() skipped a UTF-8 byte order mark, keep accepting one
+        text = resp.text.removeprefix("\ufeff")
+    except (HTTPError, TimeoutException) as e:
         _logger.warning("Failed to fetch community scripts: %s", e)
         return []
 
-    if not isinstance(data, list):
+    if not text.startswith("[", _skip_ws(text, 0)):
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            _logger.warning("Failed to decode community scripts: %s", e)
+            return []
         _logger.warning("Unexpected categories payload type: %s", type(data).__name__)
         return []
 
+    try:
+        return _collect_scripts(_iter_json_array(text))
+    except ValueError as e:
+        _logger.warning("Failed to decode community scripts: %s", e)
+        return []
+
+
+def _collect_scripts(categories: t.Iterable[t.Any]) -> list[dict[str, t.Any]]:
+    """Validate the categories payload and return a flat, deduplicated list of scripts."""
     seen: set[str] = set()
     scripts: list[dict[str, t.Any]] = []
-    for category in data:
+    for category in categories:
         if not isinstance(category, dict):
             _logger.warning("Skipping malformed category")
             continue
@@ -148,38 +245,38 @@ def _fetch_scripts() -> list[dict[str, t.Any]]:
             # Truncate description to 500 characters
             description = description[:500] if isinstance(description, str) else ""
 
+            name = name.strip()
+            # Lowercased copies are stored so that scoring doesn't re-lowercase
+            # every script on every query.
             scripts.append(
-                {"name": name.strip(), "slug": slug, "description": description}
+                {
+                    "name": name,
+                    "slug": slug,
+                    "description": description,
+                    "name_lower": name.lower(),
+                    "desc_lower": description.lower(),
+                }
             )
     return scripts
 
 
-def setup(engine_settings: dict[str, t.Any]) -> bool:
-    """Set up the engine: create the persistent cache and load HMAC key.
-
-    For more details see :py:obj:`searx.enginelib.Engine.setup`.
-    """
-    global CACHE, _HMAC_SECRET_KEY
-    CACHE = EngineCache(engine_settings["name"])
-
+def _load_hmac_secret_key(engine_settings: dict[str, t.Any]) -> bytes:
+    """Load the cache signing key, generating and persisting one if none is configured."""
     # 1. From engine_settings
     key = engine_settings.get("hmac_secret_key")
     if key:
-        _HMAC_SECRET_KEY = key if isinstance(key, bytes) else key.encode("utf-8")
-        return True
+        return key if isinstance(key, bytes) else key.encode("utf-8")
 
     # 2. From environment variable
     key_from_env = os.getenv("PROXMOXVE_CACHE_HMAC_KEY")
     if key_from_env:
-        _HMAC_SECRET_KEY = key_from_env.encode('utf-8')
-        return True
+        return key_from_env.encode('utf-8')
 
     # 3. From a local file (persistent across restarts)
     # The .hmac_secret file is ignored by git to ensure it stays instance-local.
     key_file = pathlib.Path(__file__).parent / ".hmac_secret"
     if key_file.exists():
-        _HMAC_SECRET_KEY = key_file.read_bytes()
-        return True
+        return key_file.read_bytes()
 
     # 4. Generate and store a new key
     _logger.info("Generating new HMAC secret for Proxmox VE engine cache.")
@@ -189,60 +286,97 @@ def setup(engine_settings: dict[str, t.Any]) -> bool:
     except IOError as e:
         _logger.error("Failed to write HMAC secret file: %s", e)
         # Fallback to a temporary key for this run, but it won't be persistent
-        _HMAC_SECRET_KEY = new_key
+    return new_key
+
+
+def setup(engine_settings: dict[str, t.Any]) -> bool:
+    """Set up the engine: create the persistent cache and load HMAC key.
+
+    Integrity protection of the cached catalogue can be turned off with
+    ``verify_cache_integrity: false``, in which case no key is loaded.
+
+    For more details see :py:obj:`searx.enginelib.Engine.setup`.
+    """
+    global CACHE, _HMAC_SECRET_KEY
+    CACHE = EngineCache(engine_settings["name"])
+
+    if not engine_settings.get("verify_cache_integrity", True):
+        _HMAC_SECRET_KEY = None
         return True
 
-    _HMAC_SECRET_KEY = new_key
+    key = _load_hmac_secret_key(engine_settings)
+    if len(key) > hashlib.blake2b.MAX_KEY_SIZE:
+        key = hashlib.blake2b(key).digest()
+    _HMAC_SECRET_KEY = key
     return True
 
 
-def _serialize_script(script: dict[str, t.Any]) -> bytes:
-    """Serializes, compresses and signs a script dictionary using JSON."""
-    payload = json.dumps(script, ensure_ascii=False).encode("utf-8")
-    compressed = zlib.compress(payload, level=6)  # Use balanced compression
+def _mac(key: bytes, data: bytes) -> bytes:
+    """Keyed BLAKE2b digest of ``data``, cheaper than HMAC-SHA256 for the same job."""
+    return hashlib.blake2b(data, key=key, digest_size=_MAC_SIZE).digest()
 
-    if _HMAC_SECRET_KEY:
-        mac = hmac.new(_HMAC_SECRET_KEY, compressed, hashlib.sha256).digest()
-        return mac + compressed
-    return compressed
 
+def _serialize_scripts(scripts: list[dict[str, t.Any]]) -> bytes:
+    """Serializes, compresses and signs the script catalogue using JSON."""
+    payload = json.dumps(scripts, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    compressed = zlib.compress(payload, level=_ZLIB_LEVEL)
+
+    key = _HMAC_SECRET_KEY
+    if key:
+        return _mac(key, compressed) + compressed
+    return compressed
 
-def _deserialize_script(data: bytes) -> dict[str, t.Any]:
-    """Verifies, decompresses and deserializes a script using JSON."""
-    if _HMAC_SECRET_KEY:
-        mac_size = hashlib.sha256().digest_size
-        mac, compressed = data[:mac_size], data[mac_size:]
 
-        expected_mac = hmac.new(_HMAC_SECRET_KEY, compressed, hashlib.sha256).digest()
-        if not hmac.compare_digest(mac, expected_mac):
+def _deserialize_scripts(data: bytes) -> list[dict[str, t.Any]]:
+    """Verifies, decompresses and deserializes the script catalogue using JSON."""
+    key = _HMAC_SECRET_KEY
+    if key:
+        mac, compressed = data[:_MAC_SIZE], data[_MAC_SIZE:]
+        if not hmac.compare_digest(mac, _mac(key, compressed)):
             raise ValueError("HMAC verification failed")
     else:
         compressed = data
 
     payload = zlib.decompress(compressed)
-    return json.loads(payload.decode("utf-8"))
+    scripts = json.loads(payload.decode("utf-8"))
+    if not isinstance(scripts, list):
+        raise ValueError(f"unexpected cached payload type: {type(scripts).__name__}")
+    return scripts
 
 
 def _cache_scripts(scripts: list[dict[str, t.Any]]) -> None:
-    """Serializes, compresses and caches each script individually."""
-    slugs = []
-    for script in scripts:
-        slug = script.get("slug")
-        if not slug:
-            _logger.warning("Skipping script with no slug: %s", script.get('name', 'unknown'))
-            continue
-
-        signed_script = _serialize_script(script)
-
-        if len(signed_script) > _MAX_CACHE_VALUE_LEN:
-            _logger.warning("Individual script is too large for cache, even when signed and compressed: %s (size: %d bytes)", slug, len(signed_script))
-            continue
+    """Serializes, compresses and signs the catalogue once and caches it in as
+    few chunks as :py:obj:`_MAX_CACHE_VALUE_LEN` allows."""
+    blob = _serialize_scripts(scripts)
+    chunks = [blob[i : i + _CACHE_CHUNK_LEN] for i in range(0, len(blob), _CACHE_CHUNK_LEN)]
+
+    for i, chunk in enumerate(chunks):
+        CACHE.set(f"{_CACHE_KEY}_{i}", chunk, expire=_CACHE_TTL)
+    # Written last so that readers never see a chunk count before the chunks.
+    CACHE.set(f"{_CACHE_KEY}_chunks", len(chunks), expire=_CACHE_TTL)
+    _logger.debug("Cached %d scripts in %d chunks (%d bytes).", len(scripts), len(chunks), len(blob))
+
+
+def _load_cached_scripts() -> list[dict[str, t.Any]]:
+    """Reassembles the cached catalogue, returns an empty list if the cache is
+    missing, incomplete or fails verification."""
+    chunk_count = CACHE.get(f"{_CACHE_KEY}_chunks")
+    if not isinstance(chunk_count, int) or chunk_count < 1:
+        return []
 
-        CACHE.set(f"script_{slug}", signed_script, expire=_CACHE_TTL)
-        slugs.append(slug)
+    chunks = []
+    for i in range(chunk_count):
+        chunk = CACHE.get(f"{_CACHE_KEY}_{i}")
+        if not isinstance(chunk, bytes):
+            _logger.warning("Missing chunk %d of %d from cache.", i, chunk_count)
+            return []
+        chunks.append(chunk)
 
-    CACHE.set("script_slugs_list", slugs, expire=_CACHE_TTL)
-    _logger.debug("Cached %d scripts individually.", len(slugs))
+    try:
+        return _deserialize_scripts(b"".join(chunks))
+    except (ValueError, zlib.error) as e:
+        _logger.warning("Failed to deserialize cached scripts: %s", e)
+        return []
 
 
 def init(engine_settings: dict[str, t.Any]) -> bool:  # pylint: disable=unused-argument
@@ -255,6 +389,7 @@ def init(engine_settings: dict[str, t.Any]) -> bool:  # pylint: disable=unused-a
         _logger.warning("No scripts fetched during init")
         return True
 
+    _remember_scripts(scripts)
     try:
         _cache_scripts(scripts)
     except (json.JSONDecodeError, zlib.error) as e:
@@ -263,11 +398,67 @@ def init(engine_settings: dict[str, t.Any]) -> bool:  # pylint: disable=unused-a
     return True
 
 
+def _remember_scripts(scripts: list[dict[str, t.Any]]) -> None:
+    """Keep the catalogue in process memory for :py:obj:`_MEMORY_TTL` seconds."""
+    global _SCRIPTS_MEM, _SCRIPTS_MEM_EXPIRY
+    with _SCRIPTS_MEM_LOCK:
+        _SCRIPTS_MEM = scripts
+        _SCRIPTS_MEM_EXPIRY = time.monotonic() + _MEMORY_TTL
+
+
+def _get_scripts() -> list[dict[str, t.Any]]:
+    """Return the catalogue from process memory, the persistent cache or the
+    upstream API, whichever is the first to have it."""
+    global _REFRESH_FAILED_AT
+    scripts = _SCRIPTS_MEM
+    if scripts is not None and time.monotonic() < _SCRIPTS_MEM_EXPIRY:
+        return scripts
+
+    # Only one thread refreshes the catalogue.  While an older catalogue is in
+    # memory, concurrent searches keep serving it instead of waiting for the
+    # refresh; on a cold start they wait here and then find it in memory.
+    if scripts is None:
+        _SCRIPTS_MEM_LOCK.acquire()
+    elif not _SCRIPTS_MEM_LOCK.acquire(blocking=False):
+        return scripts
+    try:
+        stale = _SCRIPTS_MEM
+        if stale is not None and time.monotonic() < _SCRIPTS_MEM_EXPIRY:
+            return stale
+
+        scripts = _load_cached_scripts()
+        if not scripts:
+            # The persistent cache is shared with other workers and cheap to
+            # read, the backoff only holds back the upstream API.
+            if _REFRESH_FAILED_AT is not None and time.monotonic() - _REFRESH_FAILED_AT < _REFRESH_BACKOFF:
+                return stale or []
+            _logger.debug("No usable cached scripts, fetching fresh data.")
+            scripts = _fetch_scripts()
+            if scripts:
+                try:
+                    _cache_scripts(scripts)
+                except (json.JSONDecodeError, zlib.error) as e:
+                    _logger.warning("Failed to serialize, compress and cache scripts from search: %s", e)
+
+        if scripts:
+            _REFRESH_FAILED_AT = None
+        else:
+            _REFRESH_FAILED_AT = time.monotonic()
+            if stale:
+                _logger.warning("Failed to refresh scripts, serving the previous catalogue.")
+                scripts = stale
+        if scripts:
+            _remember_scripts(scripts)
+        return scripts
+    finally:
+        _SCRIPTS_MEM_LOCK.release()
+
+
 def _score_script(script: dict[str, t.Any], words: list[str]) -> int:
     """Score a script against query words.  Returns 0 if any word is missing (AND logic)."""
     score = 0
-    name_lower = script["name"].lower()
-    desc_lower = script["description"].lower()
+    name_lower = script["name_lower"]
+    desc_lower = script["desc_lower"]
 
     for word in words:
         found = False
@@ -282,63 +473,40 @@ def _score_script(script: dict[str, t.Any], words: list[str]) -> int:
     return score
 
 
+def _rank_scripts(scripts: list[dict[str, t.Any]], words: list[str]) -> t.Iterator[tuple[int, int]]:
+    """Score scripts against query words and lazily yield ``(score, index)``
+    pairs of the scripts that contain every word (AND logic)."""
+    # Longer words tend to be rarer; testing them first rejects most scripts
+    # after a single substring check.
+    words = sorted(words, key=len, reverse=True)
+    return (
+        (score, idx)
+        for idx, script in enumerate(scripts)
+        if (score := _score_script(script, words)) > 0
+    )
+
+
 def search(query: str, params: "RequestParams") -> EngineResults:  # pylint: disable=unused-argument
     """Search the cached script catalogue and return scored results.
 
     Each query word is matched against script names (+10) and descriptions (+5).
-    All words must match (AND logic).  Results are sorted by score and capped
-    at :py:obj:`_MAX_RESULTS`.
+    All words must match (AND logic).  The :py:obj:`_MAX_RESULTS` best scoring
+    scripts are returned, ties keep catalogue order.
     """
     res = EngineResults()
 
     if not query or not query.strip():
         return res
 
-    scripts = []
-    slugs_list = CACHE.get("script_slugs_list")
-
-    if isinstance(slugs_list, list) and slugs_list:
-        _logger.debug("Attempting to retrieve %d scripts from individual cache entries.", len(slugs_list))
-        temp_scripts = []
-        missed_count = 0
-        for slug in slugs_list:
-            cached_script = CACHE.get(f"script_{slug}")
-            if cached_script:
-                try:
-                    script = _deserialize_script(cached_script)
-                    temp_scripts.append(script)
-                except (ValueError, zlib.error, json.JSONDecodeError) as e:
-                    _logger.warning("Failed to deserialize script with slug %s: %s", slug, e)
-                    missed_count += 1
-            else:
-                _logger.warning("Missing script with slug %s from cache.", slug)
-                missed_count += 1
-
-        if temp_scripts:
-            scripts = temp_scripts
-            _logger.debug("Successfully retrieved %d of %d scripts from cache.", len(scripts), len(slugs_list))
-            if missed_count > 0:
-                _logger.warning("Missed %d scripts from cache.", missed_count)
-        else:
-            _logger.warning("Failed to retrieve any scripts from cache. Re-fetching fresh data.")
-            scripts = []
-
-    if not scripts:
-        scripts = _fetch_scripts()
-        if scripts:
-            try:
-                _cache_scripts(scripts)
-            except (json.JSONDecodeError, zlib.error) as e:
-                _logger.warning("Failed to serialize, compress and cache scripts from search: %s", e)
-
+    scripts = _get_scripts()
     if not scripts:
         return res
 
     words = query.lower().split()
-    scored = [(s, script) for script in scripts if (s := _score_script(script, words)) > 0]
-    scored.sort(key=lambda x: x[0], reverse=True)
+    top = heapq.nlargest(_MAX_RESULTS, _rank_scripts(scripts, words), key=lambda x: x[0])
 
-    for _score, script in scored[:_MAX_RESULTS]:
+    for _score, idx in top:
+        script = scripts[idx]
         content = script["description"]
         if len(content) > 300:
             content = content[:300].rsplit(" ", 1)[0] + "..."
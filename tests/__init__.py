@@ -0,0 +1,13 @@
+"""Unit tests for the engine; ``python -m unittest`` loads them via
+:py:obj:`load_tests` instead of scanning the repository."""
+
+import unittest
+
+from . import test_community_scripts_proxmoxve
+
+
+def load_tests(
+    loader: unittest.TestLoader, standard_tests: unittest.TestSuite, pattern: str
+) -> unittest.TestSuite:
+    standard_tests.addTests(loader.loadTestsFromModule(test_community_scripts_proxmoxve))
+    return standard_tests
@@ -1,39 +1,45 @@
+import collections
+import contextlib
+import hashlib
 import importlib.util
+import json
 import pathlib
 import sys
+import threading
+import time
 import types
 import unittest
-from typing import Optional
+from typing import Iterator, Optional
 from unittest import mock
 
 
 REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
 ENGINE_PATH = REPO_ROOT / "searx/engines/community_scripts_proxmoxve.py"
+# compact, like the upstream API's own responses
+_ENCODE = json.JSONEncoder(separators=(",", ":")).encode
 
 
 class DummyLogger:
     def __init__(self) -> None:
-        self.messages: list[tuple[str, str]] = []
+        self.messages: collections.defaultdict[str, list[str]] = collections.defaultdict(list)
+
+    def _log(self, level: str, message: str, args: tuple[object, ...]) -> None:
+        self.messages[level].append(message % args if args else message)
 
     def warning(self, message: str, *args: object) -> None:
-        if args:
-            message = message % args
-        self.messages.append(("warning", message))
+        self._log("warning", message, args)
 
     def info(self, message: str, *args: object) -> None:
-        if args:
-            message = message % args
-        self.messages.append(("info", message))
+        self._log("info", message, args)
 
     def error(self, message: str, *args: object) -> None:
-        if args:
-            message = message % args
-        self.messages.append(("error", message))
+        self._log("error", message, args)
 
     def debug(self, message: str, *args: object) -> None:
-        if args:
-            message = message % args
-        self.messages.append(("debug", message))
+        self._log("debug", message, args)
+
+    def contains(self, level: str, needle: str) -> bool:
+        return any(needle in message for message in self.messages[level])
 
 
 class DummyEngineCache:
@@ -64,20 +70,18 @@ class DummyEngineResults:
 
 
 class FakeHTTPResponse:
-    def __init__(self, payload: object, status_code: int = 200) -> None:
-        self.payload = payload
+    def __init__(self, payload: object = None, status_code: int = 200, text: Optional[str] = None) -> None:
         self.status_code = status_code
-
-    def json(self) -> object:
-        return self.payload
+        # encoded once, not on every read of the body
+        self.text = _ENCODE(payload) if text is None else text
 
 
-def load_engine_module() -> tuple[types.ModuleType, DummyLogger]:
+def load_engine_module() -> types.ModuleType:
     module_name = "community_scripts_proxmoxve_test_module"
-    logger = DummyLogger()
 
     searx_module = types.ModuleType("searx")
-    searx_module.logger = types.SimpleNamespace(getChild=lambda _name: logger)
+    # tests rebind the engine's _logger to a fresh DummyLogger in setUp
+    searx_module.logger = types.SimpleNamespace(getChild=lambda _name: DummyLogger())
 
     enginelib_module = types.ModuleType("searx.enginelib")
     enginelib_module.EngineCache = DummyEngineCache
@@ -105,42 +109,79 @@ def load_engine_module() -> tuple[types.ModuleType, DummyLogger]:
         "searx.network": network_module,
         "httpx": httpx_module,
     }
-    original_modules = {key: sys.modules.get(key) for key in module_overrides}
-    original_test_module = sys.modules.get(module_name)
+    spec = importlib.util.spec_from_file_location(module_name, ENGINE_PATH)
+    if spec is None or spec.loader is None:
+        raise RuntimeError("Unable to load engine module")
+    module = importlib.util.module_from_spec(spec)
+    # the stubs are only visible while the engine's imports run
+    with swap_modules(module_overrides):
+        spec.loader.exec_module(module)
+
+    return module
+
 
+@contextlib.contextmanager
+def swap_attribute(obj: object, name: str, value: object) -> Iterator[None]:
+    """Temporarily replace ``obj.name``, a lightweight :py:obj:`mock.patch.object`
+    for tests that don't need call tracking."""
+    original = getattr(obj, name)
+    setattr(obj, name, value)
     try:
-        sys.modules.update(module_overrides)
-        sys.modules.pop(module_name, None)
+        yield
+    finally:
+        setattr(obj, name, original)
 
-        spec = importlib.util.spec_from_file_location(module_name, ENGINE_PATH)
-        if spec is None or spec.loader is None:
-            raise RuntimeError("Unable to load engine module")
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+
+@contextlib.contextmanager
+def swap_modules(overrides: dict[str, types.ModuleType]) -> Iterator[None]:
+    """Temporarily install ``overrides`` in :py:obj:`sys.modules`.  Unlike
+    :py:obj:`mock.patch.dict`, only the overridden entries are restored, so
+    modules first imported meanwhile (``hmac``, ``zlib``, ...) stay cached."""
+    originals = {name: sys.modules.get(name) for name in overrides}
+    sys.modules.update(overrides)
+    try:
+        yield
     finally:
-        if original_test_module is None:
-            sys.modules.pop(module_name, None)
-        else:
-            sys.modules[module_name] = original_test_module
-        for key, original_module in original_modules.items():
-            if original_module is None:
-                sys.modules.pop(key, None)
+        for name, original in originals.items():
+            if original is None:
+                sys.modules.pop(name, None)
             else:
-                sys.modules[key] = original_module
+                sys.modules[name] = original
+
 
-    return module, logger
+def reset_engine_state(module: types.ModuleType, logger: DummyLogger) -> None:
+    """Return a loaded engine module to its freshly imported state."""
+    module._logger = logger
+    module._HMAC_SECRET_KEY = None
+    module._SCRIPTS_MEM = None
+    module._SCRIPTS_MEM_EXPIRY = 0.0
+    module._REFRESH_FAILED_AT = None
+    # CACHE is only assigned by setup()
+    module.__dict__.pop("CACHE", None)
+
+
+_ENGINE_MODULE: Optional[types.ModuleType] = None
+
+
+def setUpModule() -> None:  # pylint: disable=invalid-name
+    # Loading (and compiling) the engine is the dominant cost of this suite,
+    # load it once for all test classes and only reset its state per test.
+    global _ENGINE_MODULE
+    _ENGINE_MODULE = load_engine_module()
 
 
 class CommunityScriptsTestBase(unittest.TestCase):
     def setUp(self) -> None:
-        self.module, self.logger = load_engine_module()
+        assert _ENGINE_MODULE is not None
+        self.module = _ENGINE_MODULE
+        self.logger = DummyLogger()
+        reset_engine_state(self.module, self.logger)
 
-    def _patch_network_get(self, payload: object, status_code: int = 200) -> mock._patch:
-        return mock.patch.object(
-            self.module,
-            "get",
-            return_value=FakeHTTPResponse(payload, status_code=status_code),
-        )
+    def _patch_network_get(
+        self, payload: object, status_code: int = 200
+    ) -> contextlib.AbstractContextManager[None]:
+        response = FakeHTTPResponse(payload, status_code=status_code)
+        return swap_attribute(self.module, "get", lambda url, timeout=None: response)
 
 
 class CommunityScriptsNetworkTests(CommunityScriptsTestBase):
@@ -156,32 +197,54 @@ class CommunityScriptsNetworkTests(CommunityScriptsTestBase):
         with self._patch_network_get([], status_code=500):
             scripts = self.module._fetch_scripts()
         self.assertEqual(scripts, [])
-        self.assertTrue(
-            any("Unexpected community scripts API status" in msg for _, msg in self.logger.messages)
-        )
+        self.assertTrue(self.logger.contains("warning", "Unexpected community scripts API status"))
 
     def test_fetch_scripts_exception(self) -> None:
-        with mock.patch.object(self.module, "get", side_effect=self.module.HTTPError("Network Error")):
+        def raise_network_error(url: str, timeout: Optional[int] = None) -> FakeHTTPResponse:
+            raise self.module.HTTPError("Network Error")
+
+        with swap_attribute(self.module, "get", raise_network_error):
             scripts = self.module._fetch_scripts()
         self.assertEqual(scripts, [])
-        self.assertTrue(
-            any("Failed to fetch community scripts" in msg for _, msg in self.logger.messages)
-        )
+        self.assertTrue(self.logger.contains("warning", "Failed to fetch community scripts"))
 
 
 class CommunityScriptsSchemaHardeningTests(CommunityScriptsTestBase):
 
+    def test_iter_json_array_decodes_items_lazily(self) -> None:
+        items = self.module._iter_json_array(' [ {"a": 1} ,\n[2], "x" ] ')
+        self.assertEqual(next(items), {"a": 1})
+        self.assertEqual(list(items), [[2], "x"])
+        self.assertEqual(list(self.module._iter_json_array("[]")), [])
+
+    def test_iter_json_array_rejects_malformed_documents(self) -> None:
+        # a byte order mark is stripped by _fetch_scripts, not here
+        for text in ("", "{}", "[1,", "[1 2]", "[1] 2", "[1,]", "\ufeff[]"):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                list(self.module._iter_json_array(text))
+
+    def test_fetch_scripts_rejects_truncated_payload(self) -> None:
+        response_text = '[{"scripts": [{"name": "Valid Script", "slug": "valid-script"}]}, {"scri'
+        response = FakeHTTPResponse(text=response_text)
+        with swap_attribute(self.module, "get", lambda url, timeout=None: response):
+            scripts = self.module._fetch_scripts()
+
+        self.assertEqual(scripts, [])
+        self.assertTrue(self.logger.contains("warning", "Failed to decode community scripts"))
+
+    def test_fetch_scripts_accepts_utf8_byte_order_mark(self) -> None:
+        response = FakeHTTPResponse(text='\ufeff[{"scripts": [{"name": "Valid Script", "slug": "valid-script"}]}]')
+        with swap_attribute(self.module, "get", lambda url, timeout=None: response):
+            scripts = self.module._fetch_scripts()
+
+        self.assertEqual([script["slug"] for script in scripts], ["valid-script"])
+
     def test_fetch_scripts_rejects_non_list_payload(self) -> None:
         with self._patch_network_get({"scripts": []}):
             scripts = self.module._fetch_scripts()
 
         self.assertEqual(scripts, [])
-        self.assertTrue(
-            any(
-                "Unexpected categories payload type" in message
-                for _level, message in self.logger.messages
-            )
-        )
+        self.assertTrue(self.logger.contains("warning", "Unexpected categories payload type"))
 
     def test_fetch_scripts_skips_malformed_category_entries(self) -> None:
         payload = [
@@ -198,11 +261,12 @@ class CommunityScriptsSchemaHardeningTests(CommunityScriptsTestBase):
                     "name": "Valid Script",
                     "slug": "valid-script",
                     "description": "",
+                    "name_lower": "valid script",
+                    "desc_lower": "",
                 }
             ],
         )
-        warning_messages = [message for _level, message in self.logger.messages]
-        self.assertTrue(any("Skipping malformed category" in msg for msg in warning_messages))
+        self.assertTrue(self.logger.contains("warning", "Skipping malformed category"))
 
     def test_fetch_scripts_skips_malformed_script_entries_within_category(self) -> None:
         payload = [
@@ -218,11 +282,12 @@ class CommunityScriptsSchemaHardeningTests(CommunityScriptsTestBase):
                     "name": "Valid Script",
                     "slug": "valid-script",
                     "description": "",
+                    "name_lower": "valid script",
+                    "desc_lower": "",
                 }
             ],
         )
-        warning_messages = [message for _level, message in self.logger.messages]
-        self.assertTrue(any("Skipping malformed script" in msg for msg in warning_messages))
+        self.assertTrue(self.logger.contains("warning", "Skipping malformed script"))
 
     def test_fetch_scripts_skips_malformed_scripts_list_in_category(self) -> None:
         payload = [
@@ -232,43 +297,41 @@ class CommunityScriptsSchemaHardeningTests(CommunityScriptsTestBase):
             scripts = self.module._fetch_scripts()
 
         self.assertEqual(scripts, [])
-        warning_messages = [message for _level, message in self.logger.messages]
-        self.assertTrue(any("Skipping malformed scripts list" in msg for msg in warning_messages))
+        self.assertTrue(self.logger.contains("warning", "Skipping malformed scripts list"))
 
     def test_fetch_scripts_handles_scripts_with_invalid_or_missing_name_slug(self) -> None:
-        payload = [
-            {
-                "scripts": [
-                    {"name": None, "slug": "missing-name"},
-                    {"name": "Missing Slug"},
-                    {"name": 123, "slug": "numeric-name"},
-                    {"name": "Numeric Slug", "slug": 456},
-                    {"name": "", "slug": "empty-name"},
-                    {"name": "Empty Slug", "slug": ""},
-                    {"name": "Valid Script", "slug": "valid-script"},
-                ]
-            }
+        valid = {"name": "Valid Script", "slug": "valid-script"}
+        # (case, script, whether the skip is logged); empty values are dropped silently
+        cases = [
+            ("none-name", {"name": None, "slug": "missing-name"}, True),
+            ("missing-slug", {"name": "Missing Slug"}, True),
+            ("numeric-name", {"name": 123, "slug": "numeric-name"}, True),
+            ("numeric-slug", {"name": "Numeric Slug", "slug": 456}, True),
+            ("empty-name", {"name": "", "slug": "empty-name"}, False),
+            ("empty-slug", {"name": "Empty Slug", "slug": ""}, False),
+            ("punctuation-slug", {"name": "Punctuation Slug", "slug": "!!!"}, False),
         ]
-        with self._patch_network_get(payload):
-            scripts = self.module._fetch_scripts()
-
-        self.assertEqual(
-            scripts,
-            [
-                {
-                    "name": "Valid Script",
-                    "slug": "valid-script",
-                    "description": "",
-                }
-            ],
-        )
-        warning_messages = [message for _level, message in self.logger.messages]
-        self.assertTrue(
-            any(
-                "Skipping script with invalid name/slug" in msg
-                for msg in warning_messages
-            )
-        )
+        for case, script, logged in cases:
+            with self.subTest(case=case):
+                self.logger = self.module._logger = DummyLogger()
+                with self._patch_network_get([{"scripts": [script, valid]}]):
+                    scripts = self.module._fetch_scripts()
+
+                self.assertEqual(
+                    scripts,
+                    [
+                        {
+                            "name": "Valid Script",
+                            "slug": "valid-script",
+                            "description": "",
+                            "name_lower": "valid script",
+                            "desc_lower": "",
+                        }
+                    ],
+                )
+                self.assertEqual(
+                    self.logger.contains("warning", "Skipping script with invalid name/slug"), logged
+                )
 
     def test_fetch_scripts_strips_whitespace_from_name_and_slug(self) -> None:
         payload = [
@@ -290,20 +353,33 @@ class CommunityScriptsSchemaHardeningTests(CommunityScriptsTestBase):
                     "name": "Whitespace Name",
                     "slug": "whitespace-slug",
                     "description": "",
+                    "name_lower": "whitespace name",
+                    "desc_lower": "",
                 },
                 {
                     "name": "Dup",
                     "slug": "dup",
                     "description": "",
+                    "name_lower": "dup",
+                    "desc_lower": "",
                 },
                 {
                     "name": "Dup Duplicate",
                     "slug": "dup-1",
                     "description": "",
+                    "name_lower": "dup duplicate",
+                    "desc_lower": "",
                 },
             ],
         )
 
+    def test_slugify_normalizes_ascii_and_unicode(self) -> None:
+        self.assertEqual(self.module._slugify("  Home_Assistant--OS!! "), "home-assistant-os")
+        self.assertEqual(self.module._slugify("Café Ünïcode"), "cafe-unicode")
+        self.assertEqual(self.module._slugify("ﬁle—name"), "file-name")
+        self.assertEqual(self.module._slugify("x" * 100), "x" * 64)
+        self.assertEqual(self.module._slugify("already-a-slug-2"), "already-a-slug-2")
+
     def test_init_and_search_continue_with_partial_bad_data(self) -> None:
         payload = [
             {
@@ -314,7 +390,7 @@ class CommunityScriptsSchemaHardeningTests(CommunityScriptsTestBase):
             }
         ]
         with self._patch_network_get(payload):
-            self.module.setup({"name": "proxmox ve community scripts"})
+            self.module.setup({"name": "proxmox ve community scripts", "hmac_secret_key": "test-key"})
             initialized = self.module.init({})
 
         self.assertTrue(initialized)
@@ -322,9 +398,226 @@ class CommunityScriptsSchemaHardeningTests(CommunityScriptsTestBase):
         results = self.module.search("docker", params)
         self.assertEqual(len(results.items), 1)
         self.assertEqual(results.items[0]["title"], "Docker LXC")
-        self.assertTrue(
-            any("Skipping malformed script" in message for _level, message in self.logger.messages)
-        )
+        self.assertTrue(self.logger.contains("warning", "Skipping malformed script"))
+
+
+class CommunityScriptsCacheTests(CommunityScriptsTestBase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.module.setup({"name": "proxmox ve community scripts", "hmac_secret_key": "test-key"})
+        self.scripts = [
+            {
+                "name": f"Script {i}",
+                "slug": f"script-{i}",
+                # hex digests barely compress, so the catalogue spans several chunks
+                "description": " ".join(
+                    hashlib.sha256(f"{i}-{j}".encode()).hexdigest() for j in range(6)
+                ),
+            }
+            for i in range(200)
+        ]
+
+    def test_cache_scripts_round_trips_across_chunks(self) -> None:
+        self.module._cache_scripts(self.scripts)
+
+        chunk_count = self.module.CACHE.get(f"{self.module._CACHE_KEY}_chunks")
+        self.assertGreater(chunk_count, 1)
+        for i in range(chunk_count):
+            self.assertLessEqual(
+                len(self.module.CACHE.get(f"{self.module._CACHE_KEY}_{i}")), self.module._MAX_CACHE_VALUE_LEN
+            )
+        self.assertEqual(self.module._load_cached_scripts(), self.scripts)
+
+    def test_load_cached_scripts_rejects_tampered_chunk(self) -> None:
+        self.module._cache_scripts(self.scripts)
+        key = f"{self.module._CACHE_KEY}_0"
+        chunk = self.module.CACHE.get(key)
+        self.module.CACHE.set(key, bytes([chunk[0] ^ 0xFF]) + chunk[1:])
+
+        self.assertEqual(self.module._load_cached_scripts(), [])
+        self.assertTrue(self.logger.contains("warning", "HMAC verification failed"))
+
+    def test_cache_integrity_can_be_disabled(self) -> None:
+        self.module.setup({"name": "proxmox ve community scripts", "verify_cache_integrity": False})
+        self.assertIsNone(self.module._HMAC_SECRET_KEY)
+
+        self.module._cache_scripts(self.scripts)
+        self.assertEqual(self.module._load_cached_scripts(), self.scripts)
+
+    def test_setup_accepts_keys_longer_than_blake2b_limit(self) -> None:
+        self.module.setup({"name": "proxmox ve community scripts", "hmac_secret_key": "k" * 100})
+        self.assertEqual(len(self.module._HMAC_SECRET_KEY), 64)
+
+        self.module._cache_scripts(self.scripts)
+        self.assertEqual(self.module._load_cached_scripts(), self.scripts)
+
+    def test_search_refetches_when_chunk_is_missing(self) -> None:
+        self.module._cache_scripts(self.scripts)
+        del self.module.CACHE.values[f"{self.module._CACHE_KEY}_1"]
+
+        payload = [{"scripts": [{"name": "Docker LXC", "slug": "docker-lxc"}]}]
+        with self._patch_network_get(payload):
+            results = self.module.search("docker", types.SimpleNamespace())
+
+        self.assertEqual([item["title"] for item in results.items], ["Docker LXC"])
+        self.assertTrue(self.logger.contains("warning", "Missing chunk 1"))
+
+
+class CommunityScriptsSearchTests(CommunityScriptsTestBase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        payload = [
+            {
+                "scripts": [
+                    {"name": "Cosmos", "slug": "cosmos", "description": "Reverse proxy and app store"},
+                    {"name": "Nginx Proxy Manager", "slug": "npm", "description": "Manage Nginx"},
+                    {"name": "OAuth2-Proxy", "slug": "oauth2-proxy", "description": "Reverse proxy for OAuth2"},
+                    {"name": "Docker", "slug": "docker", "description": "Container runtime"},
+                ]
+            }
+        ]
+        self.module.setup({"name": "proxmox ve community scripts", "hmac_secret_key": "test-key"})
+        with self._patch_network_get(payload):
+            self.module.init({})
+
+    def _titles(self, query: str) -> list[str]:
+        results = self.module.search(query, types.SimpleNamespace())
+        return [item["title"] for item in results.items]
+
+    def test_search_ranks_name_matches_above_description_matches(self) -> None:
+        self.assertEqual(self._titles("proxy"), ["OAuth2-Proxy", "Nginx Proxy Manager", "Cosmos"])
+
+    def test_search_caps_results_and_keeps_catalogue_order_for_ties(self) -> None:
+        payload = [
+            {"scripts": [{"name": f"Tool {i:02d}", "slug": f"tool-{i}"} for i in range(30)]}
+        ]
+        with self._patch_network_get(payload):
+            self.module.init({})
+
+        self.assertEqual(self._titles("tool"), [f"Tool {i:02d}" for i in range(20)])
+
+    def test_search_requires_every_word(self) -> None:
+        self.assertEqual(self._titles("REVERSE proxy"), ["OAuth2-Proxy", "Cosmos"])
+        self.assertEqual(self._titles("reverse docker"), [])
+
+    def test_search_matches_substrings(self) -> None:
+        self.assertEqual(self._titles("dock"), ["Docker"])
+        self.assertEqual(self._titles("oauth2-pro"), ["OAuth2-Proxy"])
+
+    def test_search_serves_warm_queries_from_memory(self) -> None:
+        self.module.CACHE.values.clear()
+
+        self.assertEqual(self._titles("docker"), ["Docker"])
+
+    def test_search_reloads_from_cache_once_memory_expires(self) -> None:
+        self.module._SCRIPTS_MEM_EXPIRY = 0.0
+        with mock.patch.object(self.module, "_load_cached_scripts", wraps=self.module._load_cached_scripts) as load:
+            self.assertEqual(self._titles("docker"), ["Docker"])
+            self.assertEqual(self._titles("docker"), ["Docker"])
+
+        load.assert_called_once_with()
+
+    def test_concurrent_cold_searches_fetch_once(self) -> None:
+        self.module._SCRIPTS_MEM = None
+        self.module.CACHE.values.clear()
+        fetched = [{"name": "Docker", "slug": "docker", "description": "", "name_lower": "docker", "desc_lower": ""}]
+
+        def slow_fetch() -> list[dict[str, str]]:
+            time.sleep(0.05)
+            return fetched
+
+        with mock.patch.object(self.module, "_fetch_scripts", side_effect=slow_fetch) as fetch:
+            threads = [threading.Thread(target=self.module._get_scripts) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        fetch.assert_called_once_with()
+        self.assertIs(self.module._SCRIPTS_MEM, fetched)
+
+    def test_concurrent_cold_searches_back_off_after_failed_fetch(self) -> None:
+        self.module._SCRIPTS_MEM = None
+        self.module.CACHE.values.clear()
+        results: list[list[dict[str, str]]] = []
+
+        def failing_fetch() -> list[dict[str, str]]:
+            time.sleep(0.05)
+            return []
+
+        with mock.patch.object(self.module, "_fetch_scripts", side_effect=failing_fetch) as fetch:
+            threads = [
+                threading.Thread(target=lambda: results.append(self.module._get_scripts())) for _ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        fetch.assert_called_once_with()
+        self.assertEqual(results, [[]] * 5)
+
+        # once the backoff has passed, the next search tries the API again
+        self.module._REFRESH_FAILED_AT -= self.module._REFRESH_BACKOFF
+        with mock.patch.object(self.module, "_fetch_scripts", return_value=[]) as fetch:
+            self.assertEqual(self.module._get_scripts(), [])
+        fetch.assert_called_once_with()
+
+    def test_backoff_still_reads_the_persistent_cache(self) -> None:
+        # another worker refilled the shared cache after this one failed a fetch
+        self.module._SCRIPTS_MEM = None
+        self.module._REFRESH_FAILED_AT = time.monotonic()
+
+        with mock.patch.object(self.module, "_fetch_scripts") as fetch:
+            self.assertEqual(self._titles("docker"), ["Docker"])
+
+        fetch.assert_not_called()
+        self.assertIsNone(self.module._REFRESH_FAILED_AT)
+
+    def test_search_serves_stale_memory_while_another_thread_refreshes(self) -> None:
+        stale = self.module._SCRIPTS_MEM
+        self.module._SCRIPTS_MEM_EXPIRY = 0.0
+        self.module.CACHE.values.clear()
+        fetching = threading.Event()
+        release = threading.Event()
+
+        def slow_fetch() -> list[dict[str, str]]:
+            fetching.set()
+            release.wait(timeout=5)
+            return []
+
+        with mock.patch.object(self.module, "_fetch_scripts", side_effect=slow_fetch) as fetch:
+            refresher = threading.Thread(target=self.module._get_scripts)
+            refresher.start()
+            self.assertTrue(fetching.wait(timeout=5))
+            try:
+                self.assertIs(self.module._get_scripts(), stale)
+                # answered while the refresh is still stuck in the fetch
+                self.assertTrue(refresher.is_alive())
+            finally:
+                release.set()
+                refresher.join()
+
+        fetch.assert_called_once_with()
+
+    def test_search_serves_stale_memory_when_refresh_fails(self) -> None:
+        self.module._SCRIPTS_MEM_EXPIRY = 0.0
+        self.module.CACHE.values.clear()
+
+        with self._patch_network_get([], status_code=503):
+            self.assertEqual(self._titles("docker"), ["Docker"])
+        self.assertTrue(self.logger.contains("warning", "serving the previous catalogue"))
+
+    def test_rank_scripts_is_independent_of_word_order(self) -> None:
+        scripts = [{"name_lower": f"filler {i}", "desc_lower": "media"} for i in range(20)]
+        scripts.append({"name_lower": "plex media server", "desc_lower": "stream media"})
+
+        self.assertEqual(list(self.module._rank_scripts(scripts, ["plex", "media"])), [(25, 20)])
+        self.assertEqual(list(self.module._rank_scripts(scripts, ["media", "plex"])), [(25, 20)])
+        self.assertEqual(list(self.module._rank_scripts(scripts, ["plex", "filler"])), [])
+        self.assertEqual(list(self.module._rank_scripts(scripts, ["missing", "media"])), [])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,130 @@
+"""Fetch the live Proxmox VE community scripts catalogue and report how large it
+is once serialized and compressed, along with description length statistics.
+
+This performs live network calls and is meant for manual runs only::
+
+    python tools/analyze_script_data.py
+"""
+
+import argparse
+import heapq
+import json
+import math
+import statistics
+import sys
+import typing as t
+import zlib
+
+import httpx
+
+API_URL = "https://community-scripts.github.io/ProxmoxVE/api/categories"
+
+# keep in sync with searx/engines/community_scripts_proxmoxve.py
+ZLIB_LEVEL = 6
+MAC_SIZE = 32
+CACHE_CHUNK_LEN = 10240 - 256
+
+
+def fetch_scripts(api_url: str, timeout: float) -> list[dict[str, t.Any]]:
+    """Fetch the catalogue and return a flat, deduplicated list of scripts."""
+    resp = httpx.get(api_url, timeout=timeout)
+    resp.raise_for_status()
+    data = resp.json()
+
+    # This logic is intentionally duplicated from _fetch_scripts to keep this
+    # analysis script self-contained and independent of the engine's internal
+    # dependencies.
+    if not isinstance(data, list):
+        raise ValueError("Unexpected categories payload type: not a list")
+
+    seen: set[str] = set()
+    scripts: list[dict[str, t.Any]] = []
+
+    for category in data:
+        if not isinstance(category, dict):
+            continue
+        category_scripts = category.get("scripts", [])
+        if not isinstance(category_scripts, list):
+            continue
+        for script in category_scripts:
+            if not isinstance(script, dict):
+                continue
+            name = script.get("name")
+            slug = script.get("slug")
+            if not isinstance(name, str) or not isinstance(slug, str):
+                continue
+            name = name.strip()
+            slug = slug.strip()
+            if not name or not slug:
+                continue
+            if script.get("disable") is True:
+                continue
+            if slug in seen:
+                continue
+            description = script.get("description")
+            description = description[:500] if isinstance(description, str) else ""
+            seen.add(slug)
+            scripts.append({"name": name, "slug": slug, "description": description})
+    return scripts
+
+
+def analyze(scripts: list[dict[str, t.Any]]) -> None:
+    """Print serialized sizes and description statistics of the catalogue."""
+    print(f"Fetched {len(scripts)} valid scripts.")
+
+    # Mirror the engine's cache format: compact JSON of the records including
+    # their lowercased search fields, zlib compressed and split into chunks.
+    records = [
+        {**s, "name_lower": s["name"].lower(), "desc_lower": s["description"].lower()}
+        for s in scripts
+    ]
+    serialized_scripts = json.dumps(records, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    pre_compressed_size = len(serialized_scripts)
+    print(f"Pre-compressed (JSON) size: {pre_compressed_size} bytes")
+
+    compressed_scripts = zlib.compress(serialized_scripts, level=ZLIB_LEVEL)
+    compressed_size = len(compressed_scripts)
+    print(f"Compressed size: {compressed_size} bytes")
+    print(f"Compression ratio: {pre_compressed_size / compressed_size:.2f}x")
+    print(f"Cache chunks: {math.ceil((compressed_size + MAC_SIZE) / CACHE_CHUNK_LEN)}")
+
+    print("\n--- Description Analysis ---")
+    description_lengths = [len(s.get("description", "")) for s in scripts]
+
+    if not description_lengths:
+        print("No descriptions found for analysis.")
+        return
+
+    print(f"Longest description: {max(description_lengths)} characters")
+    print(f"Shortest description: {min(description_lengths)} characters")
+    print(f"Average description length: {statistics.fmean(description_lengths):.2f} characters")
+
+    print("\nTop 5 longest descriptions (first 100 chars):")
+    for script in heapq.nlargest(5, scripts, key=lambda s: len(s.get("description", ""))):
+        description = script.get("description", "")
+        print(f"  - Length: {len(description)}, Name: {script['name']}")
+        print(f"    Description: {description[:100]}...")
+
+
+def main(argv: t.Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    parser.add_argument("--url", default=API_URL, help="categories API endpoint (default: %(default)s)")
+    parser.add_argument("--timeout", type=float, default=30, help="request timeout in seconds (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    print("--- Fetching real script data from the API ---")
+    try:
+        scripts = fetch_scripts(args.url, args.timeout)
+    except httpx.HTTPError as e:
+        print(f"Failed to fetch scripts from the API: {e}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"Failed to decode scripts from the API: {e}", file=sys.stderr)
+        return 1
+
+    analyze(scripts)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())